@@ -5,10 +5,13 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
 import os
+import threading
+import uuid
 from pathlib import Path
 
 app = FastAPI(title="Mergington High School API",
@@ -25,67 +28,116 @@ activities = {
         "description": "Learn tennis skills and participate in friendly matches",
         "schedule": "Wednesdays and Saturdays, 4:00 PM - 5:30 PM",
         "max_participants": 16,
-        "participants": ["alex@mergington.edu"]
+        "participants": {"alex@mergington.edu"}
         },
         "Basketball Team": {
         "description": "Competitive basketball team for intramural and regional tournaments",
         "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "maya@mergington.edu"]
+        "participants": {"james@mergington.edu", "maya@mergington.edu"}
         },
         "Drama Club": {
         "description": "Perform in theatrical productions and develop acting skills",
         "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["lucas@mergington.edu"]
+        "participants": {"lucas@mergington.edu"}
         },
         "Digital Art Workshop": {
         "description": "Create digital artwork using design software and tablets",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["grace@mergington.edu", "noah@mergington.edu"]
+        "participants": {"grace@mergington.edu", "noah@mergington.edu"}
         },
         "Debate Team": {
         "description": "Compete in debate competitions and develop public speaking skills",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 14,
-        "participants": ["rachel@mergington.edu"]
+        "participants": {"rachel@mergington.edu"}
         },
         "Robotics Club": {
         "description": "Design and build robots for STEM competitions",
         "schedule": "Tuesdays and Thursdays, 4:30 PM - 6:00 PM",
         "max_participants": 20,
-        "participants": ["sean@mergington.edu", "jessica@mergington.edu"]
+        "participants": {"sean@mergington.edu", "jessica@mergington.edu"}
         },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
+# Guards participant updates, since sync handlers run concurrently in a threadpool
+participants_lock = threading.Lock()
+
+# Bumped on every write so GET /activities can answer If-None-Match with 304.
+# The boot ID keeps tags from a previous process from matching after a restart.
+_BOOT_ID = uuid.uuid4().hex[:12]
+_activities_version = 0
+
+
+def mark_activities_changed():
+    """Invalidate the current /activities ETag"""
+    global _activities_version
+    _activities_version += 1
+
+
+def _etag_matches(if_none_match, etag):
+    """Check an If-None-Match header (weak tags, lists or *) against an ETag"""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+class Activity(BaseModel):
+    description: str
+    schedule: str
+    max_participants: int
+    participants: list[str]
+
+
+class SignupItem(BaseModel):
+    activity: str
+    email: str
+
+
+class BatchSignupRequest(BaseModel):
+    items: list[SignupItem]
+
 
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
-@app.get("/activities")
-def get_activities():
-    return activities
+@app.get("/activities", response_model=dict[str, Activity])
+def get_activities(request: Request, response: Response):
+    etag = f'"{_BOOT_ID}-{_activities_version}"'
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # Participants are stored as sets for O(1) membership checks; JSON needs lists
+    return {
+        name: {**activity, "participants": sorted(activity["participants"])}
+        for name, activity in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -98,14 +150,29 @@ def signup_for_activity(activity_name: str, email: str):
     # Get the specific activity
     activity = activities[activity_name]
 
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student already signed up for this activity")
-    # Add student
-    activity["participants"].append(email)
+    with participants_lock:
+        # Validate student is not already signed up
+        if email in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student already signed up for this activity")
+        # Add student
+        activity["participants"].add(email)
+        mark_activities_changed()
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
+@app.post("/activities/signups:batch")
+def batch_signup_for_activities(batch: BatchSignupRequest):
+    """Sign up several students in one request, reporting a result per item"""
+    results = []
+    for item in batch.items:
+        try:
+            result = signup_for_activity(item.activity, item.email)
+            results.append({"status_code": 200, **result})
+        except HTTPException as e:
+            results.append({"status_code": e.status_code, "detail": e.detail})
+    return {"results": results}
+
+
 @app.post("/activities/{activity_name}/unregister")
 def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
@@ -116,10 +183,12 @@ def unregister_from_activity(activity_name: str, email: str):
     # Get the specific activity
     activity = activities[activity_name]
 
-    # Validate student is signed up
-    if email not in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
-    
-    # Remove student
-    activity["participants"].remove(email)
+    with participants_lock:
+        # Validate student is signed up
+        if email not in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
+
+        # Remove student
+        activity["participants"].remove(email)
+        mark_activities_changed()
     return {"message": f"Removed {email} from {activity_name}"}
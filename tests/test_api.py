@@ -2,92 +2,175 @@
 Test suite for Mergington High School Activities API
 """
 
+import asyncio
+import re
+from types import MappingProxyType
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Save original state
-    original_activities = {
-        "Tennis Club": {
-            "description": "Learn tennis skills and participate in friendly matches",
-            "schedule": "Wednesdays and Saturdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball team for intramural and regional tournaments",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "maya@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in theatrical productions and develop acting skills",
-            "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["lucas@mergington.edu"]
-        },
-        "Digital Art Workshop": {
-            "description": "Create digital artwork using design software and tablets",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["grace@mergington.edu", "noah@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Compete in debate competitions and develop public speaking skills",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 14,
-            "participants": ["rachel@mergington.edu"]
-        },
-        "Robotics Club": {
-            "description": "Design and build robots for STEM competitions",
-            "schedule": "Tuesdays and Thursdays, 4:30 PM - 6:00 PM",
-            "max_participants": 20,
-            "participants": ["sean@mergington.edu", "jessica@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+@pytest.fixture(scope="session")
+def app_module():
+    """Import the application lazily so test collection stays cheap"""
+    import src.app
+    return src.app
+
+
+@pytest.fixture(scope="session")
+def app(app_module):
+    """The FastAPI app under test"""
+    return app_module.app
+
+
+@pytest.fixture(scope="session")
+def activities(app_module):
+    """The app's in-memory activity database"""
+    return app_module.activities
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a test client for the FastAPI app, shared across the session"""
+    from fastapi.testclient import TestClient
+    with TestClient(app) as c:
+        yield c
+
+
+_SIGNUP_URL = "/activities/{}/signup?email={}".format
+_UNREGISTER_URL = "/activities/{}/unregister?email={}".format
+
+# Error details are checked against the raw response body to skip JSON parsing
+_NOT_FOUND = re.compile(rb"not found", re.I)
+_ALREADY_SIGNED_UP = re.compile(rb"already signed up", re.I)
+_NOT_SIGNED_UP = re.compile(rb"not signed up", re.I)
+
+
+def _freeze(template):
+    """Wrap an activities mapping in read-only views so a test that mutates
+    the template by mistake fails loudly"""
+    return MappingProxyType({
+        name: MappingProxyType(activity) for name, activity in template.items()
+    })
+
+
+# Pristine copy of the in-memory database, restored before every test
+_ORIGINAL_ACTIVITIES = _freeze({
+    "Tennis Club": {
+        "description": "Learn tennis skills and participate in friendly matches",
+        "schedule": "Wednesdays and Saturdays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": frozenset({"alex@mergington.edu"})
+    },
+    "Basketball Team": {
+        "description": "Competitive basketball team for intramural and regional tournaments",
+        "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": frozenset({"james@mergington.edu", "maya@mergington.edu"})
+    },
+    "Drama Club": {
+        "description": "Perform in theatrical productions and develop acting skills",
+        "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": frozenset({"lucas@mergington.edu"})
+    },
+    "Digital Art Workshop": {
+        "description": "Create digital artwork using design software and tablets",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": frozenset({"grace@mergington.edu", "noah@mergington.edu"})
+    },
+    "Debate Team": {
+        "description": "Compete in debate competitions and develop public speaking skills",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 14,
+        "participants": frozenset({"rachel@mergington.edu"})
+    },
+    "Robotics Club": {
+        "description": "Design and build robots for STEM competitions",
+        "schedule": "Tuesdays and Thursdays, 4:30 PM - 6:00 PM",
+        "max_participants": 20,
+        "participants": frozenset({"sean@mergington.edu", "jessica@mergington.edu"})
+    },
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": frozenset({"michael@mergington.edu", "daniel@mergington.edu"})
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": frozenset({"emma@mergington.edu", "sophia@mergington.edu"})
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": frozenset({"john@mergington.edu", "olivia@mergington.edu"})
+    }
+})
+
+
+def _clone(template):
+    """Copy an activities mapping, sharing the immutable fields and copying
+    only the participant sets (much cheaper than copy.deepcopy)"""
+    return {
+        name: {
+            "description": activity["description"],
+            "schedule": activity["schedule"],
+            "max_participants": activity["max_participants"],
+            "participants": set(activity["participants"]),
         }
+        for name, activity in template.items()
     }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
-    
+
+
+def _restore_activities(app_module):
+    app_module.activities.clear()
+    app_module.activities.update(_clone(_ORIGINAL_ACTIVITIES))
+    app_module.mark_activities_changed()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def restore_activities_after_module(app_module):
+    """Leave activities in its original state once the last test has run"""
     yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+    _restore_activities(app_module)
+
+
+@pytest.fixture
+def reset_activities(app_module):
+    """Reset activities data before each test of a class that mutates it.
+
+    Not autouse: every test class that changes activities must opt in with
+    ``@pytest.mark.usefixtures("reset_activities")``, or it will run on
+    whatever state the previous test left behind.
+    """
+    _restore_activities(app_module)
+
+
+@pytest.fixture(scope="class")
+def reset_activities_once(app_module):
+    """Reset activities data once for a class of read-only tests"""
+    _restore_activities(app_module)
+
+
+@pytest.fixture
+def sign_up(client, activities):
+    """Return a helper that signs a student up and returns the response
+    along with the activity's live participant set"""
+    def _sign_up(activity, email):
+        response = client.post(_SIGNUP_URL(activity, email))
+        return response, activities[activity]["participants"]
+    return _sign_up
 
 
 class TestRootEndpoint:
     """Tests for the root endpoint"""
     
+    @pytest.mark.force_parallel_threads(4)
     def test_root_redirects_to_static(self, client):
         """Test that root endpoint redirects to static index.html"""
         response = client.get("/", follow_redirects=False)
@@ -95,9 +178,11 @@ class TestRootEndpoint:
         assert response.headers["location"] == "/static/index.html"
 
 
+@pytest.mark.usefixtures("reset_activities_once")
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
+    @pytest.mark.force_parallel_threads(4)
     def test_get_all_activities(self, client):
         """Test retrieving all activities"""
         response = client.get("/activities")
@@ -110,6 +195,7 @@ class TestGetActivities:
         assert "Basketball Team" in data
         assert "Programming Class" in data
     
+    @pytest.mark.force_parallel_threads(4)
     def test_activities_structure(self, client):
         """Test that each activity has the correct structure"""
         response = client.get("/activities")
@@ -123,6 +209,7 @@ class TestGetActivities:
             assert isinstance(activity_data["participants"], list)
             assert isinstance(activity_data["max_participants"], int)
     
+    @pytest.mark.force_parallel_threads(4)
     def test_tennis_club_details(self, client):
         """Test specific activity details"""
         response = client.get("/activities")
@@ -133,14 +220,53 @@ class TestGetActivities:
         assert "alex@mergington.edu" in tennis["participants"]
 
 
+@pytest.mark.thread_unsafe
+@pytest.mark.usefixtures("reset_activities")
+class TestActivitiesCaching:
+    """Tests for ETag handling on GET /activities"""
+    
+    def test_etag_not_modified(self, client, sign_up):
+        """Test that unchanged activities are answered with 304 Not Modified"""
+        response = client.get("/activities")
+        etag = response.headers["etag"]
+        
+        # Nothing has changed, so the cached copy is still valid
+        cached = client.get("/activities", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        
+        # A signup invalidates the ETag
+        sign_up("Tennis Club", "etag@mergington.edu")
+        refreshed = client.get("/activities", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["etag"] != etag
+        assert "etag@mergington.edu" in refreshed.json()["Tennis Club"]["participants"]
+    
+    @pytest.mark.parametrize("if_none_match", [
+        "W/{etag}",
+        '"stale", {etag}',
+        "*",
+    ], ids=["weak", "list", "wildcard"])
+    def test_etag_if_none_match_forms(self, client, if_none_match):
+        """Test that weak tags, tag lists and * are recognised"""
+        etag = client.get("/activities").headers["etag"]
+        header = if_none_match.format(etag=etag)
+        assert client.get("/activities", headers={"If-None-Match": header}).status_code == 304
+    
+    def test_etag_unknown_tag(self, client):
+        """Test that a tag from another process or version is not matched"""
+        response = client.get("/activities", headers={"If-None-Match": '"0"'})
+        assert response.status_code == 200
+
+
+@pytest.mark.thread_unsafe
+@pytest.mark.usefixtures("reset_activities")
 class TestSignupEndpoint:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_successful_signup(self, client):
+    def test_successful_signup(self, sign_up):
         """Test successfully signing up for an activity"""
-        response = client.post(
-            "/activities/Tennis Club/signup?email=newstudent@mergington.edu"
-        )
+        response, participants = sign_up("Tennis Club", "newstudent@mergington.edu")
         assert response.status_code == 200
         
         data = response.json()
@@ -149,68 +275,51 @@ class TestSignupEndpoint:
         assert "Tennis Club" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Tennis Club"]["participants"]
+        assert "newstudent@mergington.edu" in participants
     
-    def test_signup_duplicate_participant(self, client):
+    def test_signup_duplicate_participant(self, sign_up):
         """Test that duplicate signup is rejected"""
         # First signup
-        client.post("/activities/Tennis Club/signup?email=test@mergington.edu")
+        sign_up("Tennis Club", "test@mergington.edu")
         
         # Try to signup again
-        response = client.post("/activities/Tennis Club/signup?email=test@mergington.edu")
+        response, participants = sign_up("Tennis Club", "test@mergington.edu")
         assert response.status_code == 400
-        assert "already signed up" in response.json()["detail"].lower()
+        assert len(participants) == len(_ORIGINAL_ACTIVITIES["Tennis Club"]["participants"]) + 1
+        assert _ALREADY_SIGNED_UP.search(response.content)
     
-    def test_signup_nonexistent_activity(self, client):
-        """Test signing up for a non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-    
-    def test_signup_with_special_characters(self, client):
+    def test_signup_with_special_characters(self, sign_up):
         """Test signup with special characters in activity name"""
-        response = client.post(
-            "/activities/Programming Class/signup?email=coder@mergington.edu"
-        )
+        response, participants = sign_up("Programming Class", "coder@mergington.edu")
         assert response.status_code == 200
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "coder@mergington.edu" in activities_data["Programming Class"]["participants"]
+        assert "coder@mergington.edu" in participants
     
-    def test_signup_multiple_students_different_activities(self, client):
+    def test_signup_multiple_students_different_activities(self, sign_up):
         """Test multiple students signing up for different activities"""
         # Student 1 signs up for Tennis
-        response1 = client.post(
-            "/activities/Tennis Club/signup?email=student1@mergington.edu"
-        )
+        response1, tennis = sign_up("Tennis Club", "student1@mergington.edu")
         assert response1.status_code == 200
         
         # Student 2 signs up for Chess
-        response2 = client.post(
-            "/activities/Chess Club/signup?email=student2@mergington.edu"
-        )
+        response2, chess = sign_up("Chess Club", "student2@mergington.edu")
         assert response2.status_code == 200
         
         # Verify both signups
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "student1@mergington.edu" in activities_data["Tennis Club"]["participants"]
-        assert "student2@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "student1@mergington.edu" in tennis
+        assert "student2@mergington.edu" in chess
 
 
+@pytest.mark.thread_unsafe
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregisterEndpoint:
     """Tests for POST /activities/{activity_name}/unregister endpoint"""
     
-    def test_successful_unregister(self, client):
+    def test_successful_unregister(self, client, sign_up, activities):
         """Test successfully unregistering from an activity"""
         # First, add a participant
-        client.post("/activities/Tennis Club/signup?email=test@mergington.edu")
+        sign_up("Tennis Club", "test@mergington.edu")
         
         # Then unregister
         response = client.post(
@@ -224,11 +333,9 @@ class TestUnregisterEndpoint:
         assert "Tennis Club" in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "test@mergington.edu" not in activities_data["Tennis Club"]["participants"]
+        assert "test@mergington.edu" not in activities["Tennis Club"]["participants"]
     
-    def test_unregister_existing_participant(self, client):
+    def test_unregister_existing_participant(self, client, activities):
         """Test unregistering an existing participant from initial data"""
         response = client.post(
             "/activities/Tennis Club/unregister?email=alex@mergington.edu"
@@ -236,80 +343,84 @@ class TestUnregisterEndpoint:
         assert response.status_code == 200
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "alex@mergington.edu" not in activities_data["Tennis Club"]["participants"]
-    
-    def test_unregister_not_signed_up(self, client):
-        """Test unregistering a student who is not signed up"""
-        response = client.post(
-            "/activities/Tennis Club/unregister?email=notsignedup@mergington.edu"
-        )
-        assert response.status_code == 400
-        assert "not signed up" in response.json()["detail"].lower()
+        assert "alex@mergington.edu" not in activities["Tennis Club"]["participants"]
     
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregistering from a non-existent activity"""
-        response = client.post(
-            "/activities/Fake Club/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-    
-    def test_signup_then_unregister_workflow(self, client):
+    def test_signup_then_unregister_workflow(self, client, activities):
         """Test complete workflow: signup then unregister"""
         email = "workflow@mergington.edu"
         activity = "Drama Club"
         
-        # Get initial count
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()[activity]["participants"])
+        # Initial count is known from the template
+        initial_count = len(_ORIGINAL_ACTIVITIES[activity]["participants"])
         
         # Sign up
-        signup_response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
+        signup_response = client.post(_SIGNUP_URL(activity, email))
         assert signup_response.status_code == 200
         
         # Verify count increased
-        after_signup = client.get("/activities")
-        after_signup_count = len(after_signup.json()[activity]["participants"])
+        after_signup_count = len(activities[activity]["participants"])
         assert after_signup_count == initial_count + 1
         
         # Unregister
-        unregister_response = client.post(
-            f"/activities/{activity}/unregister?email={email}"
-        )
+        unregister_response = client.post(_UNREGISTER_URL(activity, email))
         assert unregister_response.status_code == 200
         
         # Verify count back to original
-        after_unregister = client.get("/activities")
-        after_unregister_count = len(after_unregister.json()[activity]["participants"])
+        after_unregister_count = len(activities[activity]["participants"])
         assert after_unregister_count == initial_count
 
 
+@pytest.mark.usefixtures("reset_activities_once")
+class TestErrorResponses:
+    """Tests for error responses from the signup and unregister endpoints"""
+    
+    @pytest.mark.parametrize("url,status,detail", [
+        ("/activities/Nonexistent Club/signup?email=test@mergington.edu", 404, _NOT_FOUND),
+        ("/activities/Tennis Club/signup?email=alex@mergington.edu", 400, _ALREADY_SIGNED_UP),
+        ("/activities/Fake Club/unregister?email=test@mergington.edu", 404, _NOT_FOUND),
+        ("/activities/Tennis Club/unregister?email=notsignedup@mergington.edu", 400, _NOT_SIGNED_UP),
+    ], ids=[
+        "signup-nonexistent-activity",
+        "signup-already-signed-up",
+        "unregister-nonexistent-activity",
+        "unregister-not-signed-up",
+    ])
+    def test_error_paths(self, client, url, status, detail):
+        """Test that invalid requests are rejected with a helpful detail"""
+        response = client.post(url)
+        assert response.status_code == status
+        assert detail.search(response.content)
+
+
+@pytest.mark.thread_unsafe
+@pytest.mark.usefixtures("reset_activities")
 class TestDataIntegrity:
     """Tests for data integrity and edge cases"""
     
-    def test_participant_list_persistence(self, client):
+    def test_participant_list_persistence(self, client, activities):
         """Test that participant lists are properly maintained"""
         # Add participants to multiple activities
-        client.post("/activities/Tennis Club/signup?email=student1@mergington.edu")
-        client.post("/activities/Chess Club/signup?email=student2@mergington.edu")
-        client.post("/activities/Drama Club/signup?email=student3@mergington.edu")
+        response = client.post("/activities/signups:batch", json={"items": [
+            {"activity": "Tennis Club", "email": "student1@mergington.edu"},
+            {"activity": "Chess Club", "email": "student2@mergington.edu"},
+            {"activity": "Drama Club", "email": "student3@mergington.edu"},
+        ]})
+        assert response.status_code == 200
         
-        # Get activities
-        response = client.get("/activities")
-        data = response.json()
+        tennis, chess, drama = (
+            activities[name]["participants"]
+            for name in ("Tennis Club", "Chess Club", "Drama Club")
+        )
         
         # Verify all participants are in their respective activities
-        assert "student1@mergington.edu" in data["Tennis Club"]["participants"]
-        assert "student2@mergington.edu" in data["Chess Club"]["participants"]
-        assert "student3@mergington.edu" in data["Drama Club"]["participants"]
+        assert {"student1@mergington.edu"} <= tennis
+        assert {"student2@mergington.edu"} <= chess
+        assert {"student3@mergington.edu"} <= drama
         
         # Verify they're NOT in other activities
-        assert "student1@mergington.edu" not in data["Chess Club"]["participants"]
-        assert "student2@mergington.edu" not in data["Drama Club"]["participants"]
+        assert tennis.isdisjoint({"student2@mergington.edu", "student3@mergington.edu"})
+        assert chess.isdisjoint({"student1@mergington.edu", "student3@mergington.edu"})
+        assert drama.isdisjoint({"student1@mergington.edu", "student2@mergington.edu"})
     
     def test_url_encoding_in_activity_names(self, client):
         """Test that activity names with spaces are properly handled"""
@@ -318,7 +429,7 @@ class TestDataIntegrity:
         )
         assert response.status_code == 200
     
-    def test_multiple_participants_same_activity(self, client):
+    def test_multiple_participants_same_activity(self, client, activities):
         """Test adding multiple participants to the same activity"""
         activity = "Robotics Club"
         emails = [
@@ -327,12 +438,50 @@ class TestDataIntegrity:
             "robot3@mergington.edu"
         ]
         
-        for email in emails:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
-            assert response.status_code == 200
+        response = client.post("/activities/signups:batch", json={
+            "items": [{"activity": activity, "email": email} for email in emails]
+        })
+        assert response.status_code == 200
+        for result in response.json()["results"]:
+            assert result["status_code"] == 200
         
         # Verify all were added
-        activities_response = client.get("/activities")
-        participants = activities_response.json()[activity]["participants"]
+        participants = activities[activity]["participants"]
         for email in emails:
             assert email in participants
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_signups_same_activity(self, app, activities):
+        """Test that concurrent signups for one activity are all recorded"""
+        activity = "Robotics Club"
+        emails = [f"concurrent{i}@mergington.edu" for i in range(5)]
+        urls = [_SIGNUP_URL(activity, email) for email in emails]
+        
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses = await asyncio.gather(*(ac.post(url) for url in urls))
+        
+        assert all(response.status_code == 200 for response in responses)
+        assert set(emails) <= activities[activity]["participants"]
+
+
+@pytest.mark.thread_unsafe
+@pytest.mark.usefixtures("reset_activities")
+class TestBatchSignupEndpoint:
+    """Tests for POST /activities/signups:batch endpoint"""
+    
+    def test_batch_signup_partial_failure(self, client, activities):
+        """Test that each item succeeds or fails independently"""
+        response = client.post("/activities/signups:batch", json={"items": [
+            {"activity": "Tennis Club", "email": "batch@mergington.edu"},
+            {"activity": "Tennis Club", "email": "alex@mergington.edu"},
+            {"activity": "Fake Club", "email": "batch@mergington.edu"},
+        ]})
+        assert response.status_code == 200
+        
+        results = response.json()["results"]
+        assert [r["status_code"] for r in results] == [200, 400, 404]
+        assert "batch@mergington.edu" in results[0]["message"]
+        assert "already signed up" in results[1]["detail"].lower()
+        assert "not found" in results[2]["detail"].lower()
+        assert "batch@mergington.edu" in activities["Tennis Club"]["participants"]